@@ -1,36 +1,425 @@
 """Data cleaning module."""
 
+import copy
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+
+def strip_op():
+    """
+    Returns an op for bulk_apply that strips leading and trailing spaces.
+    """
+    return lambda value: value.strip()
+
+
+def remove_op(text):
+    """
+    Returns an op for bulk_apply that removes the given text.
+    :param text: The text to remove.
+    """
+    return lambda value: value.replace(text, "")
+
+
+def to_float_op():
+    """
+    Returns an op for bulk_apply that converts a value to float.
+    """
+    return float
+
+
+def round_op(decimals):
+    """
+    Returns an op for bulk_apply that rounds a number.
+    :param decimals: Number of decimals to round by.
+    """
+    return lambda value: round(value, decimals)
 
 
 class DataCleaner:
-    def __init__(self, file_path):
+    def __init__(self, file_path, chunk_size=None, dtype=None, usecols=None,
+                 parse_dates=None, reader="pyarrow", backend="pandas",
+                 load=True):
         """
         Initializes the DataCleaner with the file path.
         :param file_path: Path to the CSV file.
+        :param chunk_size: Number of rows to parse at a time. When set, the
+        file is read in chunks and concatenated so the parser never holds the
+        whole raw file at once.
+        :param dtype: Optional column to data type mapping passed to the
+        reader. Giving explicit types skips type inference, e.g.
+        {'Temperature': np.float32} also loads the column at half the size of
+        the default float64.
+        :param usecols: Optional list of columns to load.
+        :param parse_dates: Optional list of columns to parse as dates.
+        :param reader: 'pyarrow' for the multithreaded Arrow CSV parser or
+        'pandas' for the pandas C parser. Chunked reads, dtypes that have no
+        Arrow equivalent and parse_dates other than a list of names always use
+        pandas.
+        :param backend: 'pandas' or 'polars'. With 'polars' the file is loaded
+        into a polars DataFrame and every cleaning method uses polars
+        expressions; only usecols applies to this backend.
+        :param load: Whether to load the file now. Pass False together with
+        chunk_size to stream the file with iter_chunks without ever holding
+        all of it in memory.
         """
         self.file_path = file_path
-        self.df = pd.read_csv(self.file_path)
+        self.chunk_size = chunk_size
+        self.dtype = dtype
+        self.usecols = usecols
+        self.parse_dates = parse_dates
+        self.df = None
+        if not load:
+            return
+        if backend == "polars":
+            if pl is None:
+                raise ImportError("polars is required for backend='polars'")
+            self.df = pl.read_csv(self.file_path, columns=usecols)
+            return
+        if chunk_size:
+            with self._read_chunks(chunk_size) as chunks:
+                self.df = pd.concat(chunks)
+        elif reader == "pyarrow" and self._use_arrow():
+            self.df = self._read_arrow()
+        else:
+            self.df = pd.read_csv(self.file_path, dtype=dtype,
+                                  usecols=usecols, parse_dates=parse_dates,
+                                  engine="c", low_memory=False)
+        self.df = self._arrow_strings(self.df)
+
+    def _arrow_strings(self, df):
+        """
+        Stores the text columns of a dataframe as pyarrow strings so string
+        operations run on Arrow's compute kernels instead of Python objects.
+        :param df: Dataframe to convert.
+        """
+        for column in df.columns:
+            col = df[column]
+            if isinstance(col.dtype, pd.ArrowDtype):
+                continue
+            if col.dtypes == "object":
+                inferred = pd.api.types.infer_dtype(col, skipna=True)
+                is_text = inferred == "string"
+            else:
+                is_text = pd.api.types.is_string_dtype(col.dtype)
+            if is_text:
+                df[column] = col.astype(pd.ArrowDtype(pa.string()))
+        return df
+
+    def _is_polars(self):
+        """
+        Checks whether the current dataframe is a polars DataFrame.
+        """
+        return pl is not None and isinstance(self.df, pl.DataFrame)
+
+    def _use_arrow(self):
+        """
+        Checks whether the Arrow reader can honour the dtype and parse_dates
+        arguments. parse_dates must be a list of column names.
+        """
+        parse_dates = self.parse_dates
+        if parse_dates is not None and not (
+                isinstance(parse_dates, list)
+                and all(isinstance(column, str) for column in parse_dates)):
+            return False
+        return self._arrow_types() is not None
+
+    def _arrow_types(self):
+        """
+        Maps the dtype argument to pyarrow column types for the Arrow reader.
+        Returns None when a type cannot be mapped, including a single dtype
+        for every column, so the pandas reader is used instead.
+        """
+        if not self.dtype:
+            return {}
+        if not isinstance(self.dtype, dict):
+            return None
+        column_types = {}
+        for column, dtype in self.dtype.items():
+            if isinstance(dtype, pd.CategoricalDtype) or dtype == "category":
+                if getattr(dtype, "categories", None) is not None:
+                    return None
+                column_types[column] = pa.dictionary(pa.int32(), pa.string())
+            elif isinstance(dtype, pd.ArrowDtype):
+                column_types[column] = dtype.pyarrow_dtype
+            elif (dtype in (str, "str", "string")
+                    or isinstance(dtype, pd.StringDtype)):
+                column_types[column] = pa.string()
+            else:
+                try:
+                    column_types[column] = pa.from_numpy_dtype(np.dtype(dtype))
+                except (TypeError, pa.ArrowNotImplementedError):
+                    return None
+        return column_types
+
+    def _read_arrow(self):
+        """
+        Reads the CSV file with the pyarrow parser and converts it to pandas.
+        Date and time columns are kept as text unless listed in parse_dates,
+        and empty columns are read as float, matching the pandas reader.
+        """
+        column_types = self._arrow_types()
+        table = self._arrow_table(column_types)
+        parse_dates = self.parse_dates or []
+        # Casting inferred timestamps back to text would reformat them, so
+        # read those columns again as strings to keep the text as written
+        text_types = {field.name: pa.string() for field in table.schema
+                      if pa.types.is_temporal(field.type)
+                      and field.name not in parse_dates
+                      and field.name not in column_types}
+        if text_types:
+            table = self._arrow_table({**column_types, **text_types})
+        for i, field in enumerate(table.schema):
+            if pa.types.is_null(field.type):
+                table = table.set_column(i, field.name,
+                                         table.column(i).cast(pa.float64()))
+        string_type = pd.ArrowDtype(pa.string())
+        df = table.to_pandas(self_destruct=True,
+                             types_mapper={pa.string(): string_type}.get)
+        for column in parse_dates:
+            df[column] = pd.to_datetime(df[column])
+        for column in df.columns:
+            # pandas sorts the categories it reads, Arrow keeps file order
+            if isinstance(df[column].dtype, pd.CategoricalDtype):
+                categories = sorted(df[column].cat.categories)
+                df[column] = df[column].cat.reorder_categories(categories)
+        return df
+
+    def _arrow_table(self, column_types):
+        """
+        Parses the CSV file into a pyarrow Table.
+        :param column_types: Mapping of column names to pyarrow types.
+        """
+        return pacsv.read_csv(
+            self.file_path,
+            read_options=pacsv.ReadOptions(use_threads=True,
+                                           block_size=8 << 20),
+            convert_options=pacsv.ConvertOptions(
+                column_types=column_types or None,
+                include_columns=self.usecols,
+                strings_can_be_null=True))
+
+    def _read_chunks(self, chunk_size):
+        """
+        Opens a chunked reader over the CSV file.
+        :param chunk_size: Number of rows per chunk.
+        """
+        return pd.read_csv(self.file_path, chunksize=chunk_size,
+                           dtype=self.dtype, usecols=self.usecols,
+                           parse_dates=self.parse_dates, engine="c")
+
+    def iter_chunks(self, chunk_size=None):
+        """
+        Reads the CSV file chunk by chunk and yields each chunk as its own
+        DataCleaner, so the cleaning methods can be applied per chunk and the
+        result appended to disk with
+        chunk.df.to_csv(path, mode='a', header=False). The dataframe of this
+        cleaner is left unchanged; create it with load=False to stream the
+        file without loading it first.
+        :param chunk_size: Number of rows per chunk. Defaults to the chunk size
+        given at initialization.
+        """
+        chunk_size = chunk_size or self.chunk_size
+        if not chunk_size:
+            raise ValueError("A chunk size is required to iterate in chunks")
+        with self._read_chunks(chunk_size) as reader:
+            for chunk in reader:
+                cleaner = copy.copy(self)
+                cleaner.df = self._arrow_strings(chunk)
+                yield cleaner
 
     def remove_text(self, column, text, regex=False):
         """
         Removes unwanted text from a specified column.
         :param column: The column name to clean.
         :param text: The text to remove from the column.
-        :param regex: Check if text is a regex pattern (bool)
+        :param regex: Check if text is a regex pattern (bool). See
+        remove_texts for how patterns are matched.
         """
-        if self.df[column].dtypes != "object":
+        self.remove_texts(column, [text], regex=regex)
+
+    def remove_texts(self, column, texts, regex=False):
+        """
+        Removes several unwanted texts from a specified column in one pass
+        over the column.
+        :param column: The column name to clean.
+        :param texts: List of texts to remove from the column.
+        :param regex: Check if the texts are regex patterns (bool). On Arrow
+        string columns patterns run on RE2, and compiled patterns or patterns
+        RE2 rejects fall back to Python's re.
+        """
+        if self._is_polars():
+            if self.df.schema[column] != pl.String:
+                raise Exception("Cannot remove text on a non-string column")
+            if not texts:
+                return
+            if regex:
+                pattern = self._join_patterns(texts)
+                expr = pl.col(column).str.replace_all(pattern, "")
+            else:
+                expr = pl.col(column).str.replace_many(texts,
+                                                       [""] * len(texts))
+            self.df = self.df.with_columns(expr)
+            return
+        col = self.df[column]
+        if not pd.api.types.is_string_dtype(col.dtype):
             raise Exception("Cannot remove text on a non-string column")
-        self.df[column] = self.df[column].str.replace(text, "", regex=regex)
+        if not texts:
+            return
+        if col.dtype.kind == "S":
+            if regex:
+                raise Exception("Cannot remove a regex from a bytes column")
+            values = col.to_numpy()
+            for text in texts:
+                values = np.char.replace(values, text.encode("ascii"), b"")
+            self.df[column] = values
+            return
+        if not regex and all(len(text) == 1 for text in texts):
+            table = str.maketrans("", "", "".join(texts))
+            if col.dtypes == "object":
+                self.df[column] = self._map_strings(
+                    col, lambda s: s.translate(table))
+            else:
+                self.df[column] = col.str.translate(table)
+            return
+        if not regex and col.dtypes == "object":
+            def remove(s):
+                for text in texts:
+                    s = s.replace(text, "")
+                return s
+            self.df[column] = self._map_strings(col, remove)
+            return
+        if not regex and len(texts) == 1:
+            self.df[column] = col.str.replace(texts[0], "", regex=False)
+            return
+        if regex:
+            pattern = self._join_patterns(texts)
+        else:
+            pattern = "|".join(map(re.escape, texts))
+        try:
+            self.df[column] = col.str.replace(pattern, "", regex=True)
+        except (pa.ArrowInvalid, NotImplementedError):
+            # RE2 has no lookarounds or backreferences and Arrow columns do
+            # not take compiled patterns, so use Python's re for those
+            result = col.astype(object).str.replace(pattern, "", regex=True)
+            self.df[column] = result.astype(col.dtype)
+
+    def _join_patterns(self, texts):
+        """
+        Joins regex patterns into one alternation. A single pattern is
+        returned unchanged, so compiled patterns and inline flags such as
+        '(?i)' keep working.
+        :param texts: List of regex patterns.
+        """
+        if len(texts) == 1:
+            return texts[0]
+        return "|".join(f"(?:{text})" for text in texts)
 
     def strip_spaces(self, column):
         """
         Strips leading and trailing spaces from a specified column.
         :param column: The column name to strip spaces from.
         """
-        if self.df[column].dtypes != "object":
+        if self._is_polars():
+            if self.df.schema[column] != pl.String:
+                raise TypeError("Cannot strip spaces on a non-string column")
+            self.df = self.df.with_columns(pl.col(column).str.strip_chars())
+            return
+        col = self.df[column]
+        if not pd.api.types.is_string_dtype(col.dtype):
             raise TypeError("Cannot strip spaces on a non-string column")
-        self.df[column] = self.df[column].str.strip()
+        if col.dtype.kind == "S":
+            self.df[column] = np.char.strip(col.to_numpy())
+        elif col.dtypes == "object":
+            self.df[column] = self._map_strings(col, str.strip)
+        else:
+            self.df[column] = col.str.strip()
+
+    def _map_strings(self, col, func):
+        """
+        Applies a string function to every string in an object column with a
+        plain list comprehension, which skips the per-element overhead of the
+        .str accessor. Missing values are left untouched.
+        :param col: Column to map over.
+        :param func: Function taking and returning a string.
+        :return: List of mapped values.
+        """
+        return [func(s) if isinstance(s, str) else s for s in col.tolist()]
+
+    def bulk_apply(self, column, ops):
+        """
+        Applies a sequence of ops to a column in a single pass, instead of
+        chaining strip_spaces, remove_text, to_float and round, which each
+        walk the whole column. Missing values stay missing, and a text
+        column keeps its string type when the ops return strings.
+        Example: bulk_apply('Temp', [strip_op(), remove_op(','), to_float_op(),
+        round_op(2)])
+        :param column: Name of column.
+        :param ops: List of functions each taking and returning one value.
+        """
+        def apply(value):
+            for op in ops:
+                value = op(value)
+            return value
+
+        col = self.df[column]
+        values = [None if pd.isna(value) else apply(value)
+                  for value in col.to_list()]
+        if self._is_polars():
+            self.df = self.df.with_columns(pl.Series(column, values))
+            return
+        result = pd.Series(values, index=col.index)
+        if (pd.api.types.is_string_dtype(col.dtype)
+                and pd.api.types.infer_dtype(result, skipna=True) == "string"):
+            result = result.astype(col.dtype)
+        self.df[column] = result
+
+    def apply_many(self, method, columns, **kwargs):
+        """
+        Runs a column cleaning method over several columns in a thread pool.
+        Each column is cleaned on its own single-column frame and the results
+        are written back to the dataframe one by one afterwards.
+        Example: apply_many('strip_spaces', ['City', 'Country'])
+        :param method: Name of the cleaning method, e.g. 'strip_spaces'.
+        :param columns: List of columns to clean.
+        :param kwargs: Extra arguments passed to the method.
+        """
+        methods = {"remove_text", "remove_texts", "strip_spaces", "bulk_apply",
+                   "to_float", "round", "clean_float"}
+        if method not in methods:
+            raise ValueError(f"Cannot apply {method} to several columns")
+
+        def clean(column):
+            worker = copy.copy(self)
+            if self._is_polars():
+                worker.df = self.df.select(column)
+            else:
+                worker.df = pd.DataFrame({column: self.df[column]})
+            getattr(worker, method)(column, **kwargs)
+            return worker.df[column]
+
+        with ThreadPoolExecutor() as executor:
+            results = dict(zip(columns, executor.map(clean, columns)))
+        if self._is_polars():
+            self.df = self.df.with_columns(results.values())
+        else:
+            for column, values in results.items():
+                self.df[column] = values
 
     def handle_missing(self, column, strategy="mean"):
         """
@@ -39,11 +428,41 @@ class DataCleaner:
         :param strategy: The strategy to handle missing values ('mean', 'zero',
         etc.).
         """
-        if strategy == "mean":
-            mean_value = self.df[column].mean()
-            self.df[column] = self.df[column].fillna(mean_value)
-        elif strategy == "zero":
-            self.df[column] = self.df[column].fillna(0)
+        if self._is_polars():
+            # polars reads NaN fields as NaN rather than null
+            if self.df.schema[column].is_float():
+                self.df = self.df.with_columns(pl.col(column).fill_nan(None))
+            if strategy == "mean":
+                fill = pl.col(column).mean()
+                self.df = self.df.with_columns(pl.col(column).fill_null(fill))
+            elif strategy == "zero":
+                self.df = self.df.with_columns(pl.col(column).fill_null(0))
+            elif strategy == "drop":
+                self.df = self.df.drop_nulls(subset=[column])
+            return
+        if strategy in ("mean", "zero"):
+            col = self.df[column]
+            values = col.to_numpy()
+            if values.dtype.kind != "f":
+                fill = col.mean() if strategy == "mean" else 0
+                self.df[column] = col.fillna(fill)
+                return
+            mask = np.isnan(values)
+            missing = np.count_nonzero(mask)
+            if not missing or (strategy == "mean" and missing == len(values)):
+                return
+            fill = 0
+            # bottleneck sums in the input dtype, so only use it for float64
+            if (strategy == "mean" and bn is not None
+                    and values.dtype == np.float64):
+                fill = bn.nanmean(values)
+            elif strategy == "mean":
+                fill = (np.sum(values, where=~mask, dtype=np.float64)
+                        / (len(values) - missing))
+            if not values.flags.writeable:
+                values = values.copy()
+            np.copyto(values, fill, where=mask)
+            self.df[column] = values
         elif strategy == "drop":
             self.df = self.df.dropna(subset=[column])
 
@@ -52,15 +471,35 @@ class DataCleaner:
         Drops unwanted columns from the dataset.
         :param columns: List of column names to drop.
         """
-        self.df = self.df.drop(columns=columns)
+        if self._is_polars():
+            self.df = self.df.drop(columns)
+            return
+        self.df.drop(columns=columns, inplace=True)
 
     def save_data(self, output_path):
         """
-        Saves the cleaned data to a new CSV file.
-        :param output_path: Path where the cleaned data should be saved.
+        Saves the cleaned data to a new CSV file. Rows are written in chunks
+        through a 1 MB file buffer, or compressed when the path ends in a
+        compression suffix such as .gz.
+        :param output_path: Path, URL or file-like object where the cleaned
+        data should be saved.
         """
         try:
-            self.df.to_csv(output_path, index=False)
+            if self._is_polars():
+                self.df.write_csv(output_path)
+                print(f"Data successfully saved to {output_path}")
+                return
+            compressed = (".gz", ".bz2", ".zip", ".xz", ".zst", ".tar")
+            local = (isinstance(output_path, (str, os.PathLike))
+                     and "://" not in str(output_path)
+                     and not str(output_path).lower().endswith(compressed))
+            if local:
+                with open(output_path, "w", buffering=1 << 20, newline="",
+                          encoding="utf-8") as f:
+                    self.df.to_csv(f, index=False, chunksize=100_000)
+            else:
+                # Buffers, URLs and compressed paths are handled by pandas
+                self.df.to_csv(output_path, index=False, chunksize=100_000)
             print(f"Data successfully saved to {output_path}")
         except Exception as e:
             print(f"Error saving file: {e}")
@@ -72,12 +511,39 @@ class DataCleaner:
         """
         return self.df.head(n)
 
-    def to_float(self, column):
+    def to_float(self, column, dtype=np.float64):
         """
         Convert specfied column to float data type.
         :param column: Name of column.
+        :param dtype: Float type to convert to. Pass np.float32 to halve the
+        memory of the column, at the cost of precision: integers above 2**24
+        are rounded.
         """
-        self.df[column] = self.df[column].astype(float)
+        if self._is_polars():
+            float_type = pl.Float64
+            if np.dtype(dtype) == np.float32:
+                float_type = pl.Float32
+            self.df = self.df.with_columns(pl.col(column).cast(float_type))
+            return
+        self.df[column] = self.df[column].astype(dtype)
+
+    def downcast(self):
+        """
+        Downcasts every numeric column to the smallest float or integer type
+        that holds its values.
+        """
+        if self._is_polars():
+            self.df = self.df.with_columns(
+                self.df[column].shrink_dtype()
+                for column, dtype in self.df.schema.items()
+                if dtype.is_numeric())
+            return
+        kinds = {"f": "float", "i": "integer", "u": "unsigned"}
+        for column in self.df.columns:
+            dtype = self.df[column].dtype
+            if isinstance(dtype, np.dtype) and dtype.kind in kinds:
+                self.df[column] = pd.to_numeric(self.df[column],
+                                                downcast=kinds[dtype.kind])
 
     def round(self, column, decimals):
         """
@@ -85,14 +551,75 @@ class DataCleaner:
         :param column: Name of column.
         :param decimals: Number of decimals to round by.
         """
+        if self._is_polars():
+            self.df = self.df.with_columns(pl.col(column).round(decimals))
+            return
         self.df[column] = self.df[column].round(decimals)
 
+    def clean_float(self, column, decimals, fill=0):
+        """
+        Converts a column to float, rounds it and fills missing values in one
+        step, working on a single numpy buffer instead of going through
+        to_float, round and handle_missing.
+        :param column: Name of column.
+        :param decimals: Number of decimals to round by.
+        :param fill: Value to put in place of missing values.
+        """
+        if self._is_polars():
+            expr = pl.col(column).cast(pl.Float64).round(decimals)
+            self.df = self.df.with_columns(
+                expr.fill_nan(fill).fill_null(fill))
+            return
+        values = self.df[column].to_numpy(dtype=np.float64, na_value=np.nan,
+                                          copy=True)
+        np.round(values, decimals, out=values)
+        np.copyto(values, fill, where=np.isnan(values))
+        self.df[column] = values
+
+    def as_bytes(self, column, width):
+        """
+        Stores an ASCII text column as fixed-width bytes, so remove_text and
+        strip_spaces run on one contiguous numpy buffer instead of a Python
+        object per cell. Values read back as bytes, e.g. b'NY'. The column is
+        left unchanged if it has missing or non-ASCII values, or any value is
+        longer than width. Has no effect on the polars backend, which already
+        keeps strings in Arrow buffers.
+        :param column: Name of column.
+        :param width: Maximum number of bytes per value.
+        """
+        if self._is_polars():
+            return
+        try:
+            encoded = [s.encode("ascii") for s in self.df[column].tolist()]
+        except (AttributeError, UnicodeEncodeError):
+            return
+        if any(len(value) > width for value in encoded):
+            return
+        self.df[column] = np.array(encoded, dtype=f"S{width}")
+
+    def categorize(self, columns):
+        """
+        Converts columns to categorical type so grouping, sorting and
+        filtering on them compare integer codes instead of strings. Worth it
+        for low-cardinality key columns that are used more than once.
+        :param columns: List of column names to convert.
+        """
+        if self._is_polars():
+            categorical = pl.col(columns).cast(pl.Categorical)
+            self.df = self.df.with_columns(categorical)
+            return
+        for column in columns:
+            self.df[column] = self.df[column].astype("category")
+
     def new_column(self, column, items):
         """
         Add new column in dataframe.
         :param column: Name of column.
         :param items: List of items to be added to column.
         """
+        if self._is_polars():
+            self.df = self.df.with_columns(pl.Series(column, items))
+            return
         self.df[column] = items
 
     def sort_column(self, column, ascending=True):
@@ -101,50 +628,68 @@ class DataCleaner:
         order.
         :param column: Name of the column to sort by.
         :param ascending: Boolean indicating whether or not to sort by
-        ascending order.
+        ascending order. Rows with equal values keep their original order.
         """
-        self.df = self.df.sort_values(by=column, ascending=ascending)
-        self.df = self.df.reset_index(drop=True)
+        if self._is_polars():
+            self.df = self.df.sort(column, descending=not ascending,
+                                   nulls_last=True, maintain_order=True)
+            return
+        self.df = self.df.sort_values(by=column, ascending=ascending,
+                                      ignore_index=True, kind="stable")
 
     def count_missing_values(self):
-        return self.df.isnull().sum()
+        """
+        Counts missing values per column, one column at a time so no boolean
+        copy of the whole dataframe is built.
+        """
+        if self._is_polars():
+            missing = [
+                (pl.col(column).is_null() | pl.col(column).is_nan()).sum()
+                if dtype.is_float() else pl.col(column).null_count()
+                for column, dtype in self.df.schema.items()]
+            counts = self.df.select(missing).row(0)
+            return pd.Series(counts, index=self.df.columns, dtype="int64")
+        counts = {}
+        for column in self.df.columns:
+            col = self.df[column]
+            if not isinstance(col.dtype, np.dtype):
+                counts[column] = col.isna().sum()
+                continue
+            values = col.to_numpy()
+            if values.dtype.kind in "fc":
+                counts[column] = np.count_nonzero(values != values)
+            elif values.dtype.kind in "OmM":
+                counts[column] = np.count_nonzero(pd.isna(values))
+            else:
+                counts[column] = 0
+        return pd.Series(counts, index=self.df.columns, dtype="int64")
 
     def aggregate_data(self, columns, aggregate_method='mean'):
         """
         Groups the dataframe by the specified columns and performs the
-        specified aggregation method.
+        specified aggregation method. Groups are returned in order of first
+        appearance.
         :param columns: List of columns to be grouped.
-        :param aggregate_method: Aggregation method to apply.
+        :param aggregate_method: Aggregation method to apply. Like pandas,
+        mean and median raise TypeError when a non-key column is not numeric.
+        On the polars backend sum does too, where pandas joins the strings.
         """
-        df_grouped = self.df.groupby(columns)
-
-        if aggregate_method.lower() == 'mean':
-            self.df = df_grouped.mean()
-            self.df = self.df.reset_index(drop=False)
-
-        elif aggregate_method.lower() == 'min':
-            self.df = df_grouped.min()
-            self.df = self.df.reset_index(drop=False)
-
-        elif aggregate_method.lower() == 'max':
-            self.df = df_grouped.max()
-            self.df = self.df.reset_index(drop=False)
-
-        elif aggregate_method.lower() == 'sum':
-            self.df = df_grouped.sum()
-            self.df = self.df.reset_index(drop=False)
-
-        elif aggregate_method.lower() == 'count':
-            self.df = df_grouped.count()
-            self.df = self.df.reset_index(drop=False)
-
-        elif aggregate_method.lower() == 'median':
-            self.df = df_grouped.median()
-            self.df = self.df.reset_index(drop=False)
-
-        else:
-            self.df = df_grouped.mean()
-            self.df = self.df.reset_index(drop=False)
+        methods = {"mean", "min", "max", "sum", "count", "median"}
+        method = aggregate_method.lower()
+        if method not in methods:
+            method = "mean"
+        if self._is_polars():
+            keys = [columns] if isinstance(columns, str) else columns
+            text = [column for column, dtype in self.df.schema.items()
+                    if column not in keys
+                    and not (dtype.is_numeric() or dtype == pl.Boolean)]
+            if method in ("mean", "median", "sum") and text:
+                raise TypeError(f"Cannot {method} non-numeric columns {text}")
+            grouped = self.df.group_by(columns, maintain_order=True)
+            self.df = grouped.agg(getattr(pl.all(), method)())
+            return
+        df_grouped = self.df.groupby(columns, sort=False, observed=True)
+        self.df = df_grouped.agg(method).reset_index()
 
     def filter_by_column(self, column, value):
         """
@@ -152,4 +697,18 @@ class DataCleaner:
         :param column: The column to be filtered.
         :param value: The value to be filtered by.
         """
-        self.df = self.df[self.df[column] == value]
+        if self._is_polars():
+            self.df = self.df.filter(pl.col(column) == value)
+            return
+        col = self.df[column]
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            if value in col.cat.categories:
+                codes = col.cat.codes.to_numpy()
+                mask = codes == col.cat.categories.get_loc(value)
+            else:
+                mask = np.zeros(len(col), dtype=bool)
+        elif isinstance(col.dtype, np.dtype) and col.dtype.kind in "biufc":
+            mask = col.to_numpy() == value
+        else:
+            mask = (col == value).to_numpy(dtype=bool, na_value=False)
+        self.df = self.df.iloc[mask]